@@ -2,6 +2,50 @@ import requests
 import json
 import os
 import time
+import atexit
+import hashlib
+import pickle
+import shelve
+import asyncio
+
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class _TokenBucket:
+    """
+    A minimal token-bucket rate limiter shared by the sync and async fetch
+    paths. Only blocks when the per-second request budget is exhausted.
+    """
+    def __init__(self, rate, burst=2):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+
+    def _take(self):
+        """Refills the bucket; returns 0 if a token was taken, else seconds to wait."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
 
 class FreeDictionaryClient:
     """
@@ -9,44 +53,158 @@ class FreeDictionaryClient:
     It includes caching to avoid redundant API calls and ensure reproducibility.
     """
     API_URL = "https://api.dictionaryapi.dev/api/v2/entries/en/"
-    CACHE_FILE = "cache.json"
+    CACHE_FILE = "cache.db"
+    LEGACY_CACHE_FILE = "cache.json"
+    MAX_CONCURRENCY = 8
+    REQUESTS_PER_SECOND = 2.0
+    # Definitions are stable, so cache hits are honored for a week;
+    # failed lookups are retried after a day.
+    POSITIVE_TTL = 7 * 24 * 3600
+    NEGATIVE_TTL = 24 * 3600
 
     def __init__(self):
-        self.cache = self._load_cache()
-
-    def _load_cache(self):
-        """Loads the API response cache from a file."""
-        if os.path.exists(self.CACHE_FILE):
-            with open(self.CACHE_FILE, 'r') as f:
-                try:
-                    return json.load(f)
-                except json.JSONDecodeError:
-                    return {}
-        return {}
-
-    def _save_cache(self):
-        """Saves the current cache to a file."""
-        with open(self.CACHE_FILE, 'w') as f:
-            json.dump(self.cache, f, indent=4)
+        # shelve gives O(1) per-key writes instead of rewriting the whole
+        # cache file on every fetch.
+        self.cache = shelve.open(self.CACHE_FILE, protocol=pickle.HIGHEST_PROTOCOL)
+        atexit.register(self.close)
+        self._import_legacy_cache()
+        # In-process layer on top of the shelve store, so repeated lookups
+        # of the same word within a run never touch the dbm file.
+        self._mem = {}
+        # A shared session keeps the TCP/TLS connection alive across
+        # sequential lookups instead of handshaking per request.
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'ALLA-POC/1.0'})
+        # A sized connection pool plus automatic backoff on transient
+        # failures (connection resets, 429/5xx) at the transport layer.
+        adapter = HTTPAdapter(
+            pool_connections=20, pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504]))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.limiter = _TokenBucket(self.REQUESTS_PER_SECOND)
+
+    def _import_legacy_cache(self):
+        """One-shot migration of the old cache.json into the shelve store."""
+        if not os.path.exists(self.LEGACY_CACHE_FILE):
+            return
+        with open(self.LEGACY_CACHE_FILE, 'r') as f:
+            try:
+                legacy = json.load(f)
+            except json.JSONDecodeError:
+                return
+        for word, data in legacy.items():
+            if word not in self.cache:
+                self.cache[word] = data
+        self.cache.sync()
+
+    def _cache_get(self, word):
+        """
+        Looks a word up in the in-process and on-disk caches.
+        Returns (hit, data); entries past their TTL count as misses.
+        """
+        if word in self._mem:
+            return True, self._mem[word]
+        if word not in self.cache:
+            return False, None
+        entry = self.cache[word]
+        if isinstance(entry, dict) and 'ts' in entry and 'data' in entry:
+            data = entry['data']
+            ttl = self.POSITIVE_TTL if data is not None else self.NEGATIVE_TTL
+            if time.time() - entry['ts'] > ttl:
+                return False, None
+        else:
+            data = entry  # Legacy entry without a timestamp.
+        self._mem[word] = data
+        return True, data
+
+    def _cache_put(self, word, data, etag=None, body_hash=None):
+        """Stores a result (including None for failed lookups) with a timestamp."""
+        self._mem[word] = data
+        self.cache[word] = {'ts': time.time(), 'data': data, 'etag': etag, 'hash': body_hash}
+
+    def close(self):
+        """Closes the on-disk cache."""
+        try:
+            self.cache.close()
+        except ValueError:
+            pass  # Already closed.
+
+    async def _fetch(self, session, semaphore, word):
+        """Fetches a single word's definition, bounded by the semaphore and rate limiter."""
+        async with semaphore:
+            await self.limiter.acquire_async()
+            try:
+                async with session.get(f"{self.API_URL}{word}") as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except aiohttp.ClientError as e:
+                print(f"Error fetching definition for '{word}': {e}")
+                return None
+
+    async def _gather_definitions(self, words):
+        """Issues concurrent fetches for all the given words."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        async with aiohttp.ClientSession() as session:
+            tasks = [self._fetch(session, semaphore, word) for word in words]
+            return await asyncio.gather(*tasks)
+
+    def get_definitions(self, words):
+        """
+        Retrieves definitions for a batch of words concurrently.
+        Cached words are served locally; only the misses hit the network.
+        Returns a dict mapping each word to its API data (or None on failure).
+        """
+        words = [word.lower() for word in words]
+        missing = [word for word in dict.fromkeys(words) if not self._cache_get(word)[0]]
+        if missing:
+            results = asyncio.run(self._gather_definitions(missing))
+            for word, data in zip(missing, results):
+                self._cache_put(word, data)
+            self.cache.sync()
+        return {word: self._cache_get(word)[1] for word in words}
 
     def get_definition(self, word):
         """
         Retrieves the definition of a word, using cache if available.
         """
-        if word in self.cache:
-            return self.cache[word]
+        word = word.lower()
+        hit, data = self._cache_get(word)
+        if hit:
+            return data
+
+        # An expired entry can still be revalidated cheaply: send its ETag
+        # and compare body hashes so unchanged payloads cost no re-parse.
+        stale = self.cache.get(word)
+        if not isinstance(stale, dict) or 'data' not in stale:
+            stale = None
+        headers = {}
+        if stale is not None and stale.get('etag'):
+            headers['If-None-Match'] = stale['etag']
 
         try:
-            response = requests.get(f"{self.API_URL}{word}")
+            # Only blocks when the request budget is actually exhausted,
+            # unlike the old unconditional time.sleep(0.5).
+            self.limiter.acquire()
+            response = self.session.get(f"{self.API_URL}{word}", headers=headers, timeout=5)
+            if response.status_code == 304 and stale is not None:
+                # Unchanged upstream: keep the cached data, refresh its TTL.
+                self._cache_put(word, stale['data'], etag=stale.get('etag'),
+                                body_hash=stale.get('hash'))
+                self.cache.sync()
+                return stale['data']
             response.raise_for_status()  # Raise an exception for bad status codes
-            data = response.json()
-            self.cache[word] = data
-            self._save_cache()
-            # To avoid hitting rate limits
-            time.sleep(0.5)
+            body_hash = hashlib.blake2b(response.content).hexdigest()
+            if stale is not None and body_hash == stale.get('hash'):
+                data = stale['data']  # Same payload; skip re-deserializing.
+            else:
+                data = response.json()
+            self._cache_put(word, data, etag=response.headers.get('ETag'), body_hash=body_hash)
+            self.cache.sync()
             return data
         except requests.exceptions.RequestException as e:
             print(f"Error fetching definition for '{word}': {e}")
-            self.cache[word] = None  # Cache failures to avoid retrying
-            self._save_cache()
+            self._cache_put(word, None)  # Cache failures to avoid retrying
+            self.cache.sync()
             return None
\ No newline at end of file
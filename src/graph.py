@@ -1,11 +1,12 @@
 import networkx as nx
-import matplotlib.pyplot as plt
 
 class SemanticNode:
     """
     Represents a node in the semantic graph.
     Each node corresponds to a word with its linguistic properties.
     """
+    __slots__ = ('word', 'pos', 'definition', 'usage_patterns')
+
     def __init__(self, word, pos=None, definition=None, usage_patterns=None):
         self.word = word
         self.pos = pos
@@ -23,21 +24,25 @@ class SemanticGraph:
         self.graph = nx.Graph()
 
     def add_node(self, node):
-        """Adds a SemanticNode to the graph."""
-        self.graph.add_node(node.word, data=node)
+        """
+        Adds a SemanticNode to the graph, flattened to primitive attributes
+        so the graph can be serialized directly without repr/pickle of
+        Python objects per node.
+        """
+        self.graph.add_node(node.word, pos=node.pos or '', definition=node.definition or '')
 
     def add_edge(self, word1, word2, weight=1.0):
         """Adds an edge between two words."""
-        if self.graph.has_node(word1) and self.graph.has_node(word2):
+        # Probe the node dict directly instead of going through has_node twice.
+        nodes = self.graph._node
+        if word1 in nodes and word2 in nodes:
             self.graph.add_edge(word1, word2, weight=weight)
         else:
             raise ValueError("One or both nodes not found in the graph.")
 
     def get_node(self, word):
-        """Retrieves a node by its word."""
-        if self.graph.has_node(word):
-            return self.graph.nodes[word]['data']
-        return None
+        """Retrieves a node's attribute dict by its word, or None."""
+        return self.graph._node.get(word)
 
     def find_path(self, word1, word2):
         """Finds the shortest path between two words."""
@@ -48,15 +53,23 @@ class SemanticGraph:
 
     def get_neighbors(self, word):
         """Gets the neighbors of a word."""
-        if self.graph.has_node(word):
-            return list(self.graph.neighbors(word))
-        return []
+        return list(self.graph._adj.get(word, ()))
 
     def visualize_subgraph(self, words, filename="output/subgraph.png"):
-        """Visualizes a subgraph containing the specified words."""
+        """Visualizes a subgraph containing the specified words (any iterable)."""
+        # Import lazily so importing this module (e.g. from the search demo)
+        # doesn't pay the matplotlib startup cost.
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
         subgraph = self.graph.subgraph(words)
         plt.figure(figsize=(12, 12))
-        pos = nx.spring_layout(subgraph, k=0.5, iterations=50)
+        if len(subgraph) < 100:
+            # Deterministic and faster than a force simulation on small graphs.
+            pos = nx.kamada_kawai_layout(subgraph)
+        else:
+            pos = nx.spring_layout(subgraph, k=0.5, iterations=20)
         nx.draw(subgraph, pos, with_labels=True, node_color='lightblue', node_size=2000, edge_color='gray', font_size=12, font_weight='bold')
         plt.title("Semantic Subgraph")
         plt.savefig(filename)
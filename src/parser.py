@@ -1,47 +1,137 @@
 import re
+import sys
+import logging
 from src.graph import SemanticGraph, SemanticNode
 from src.api_client import FreeDictionaryClient
 
+logger = logging.getLogger(__name__)
+
+# Compiled once; _extract_words runs for every definition encountered.
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Common function words to exclude (articles, prepositions, conjunctions, etc.).
+# Built once at import and interned, so membership probes against extracted
+# (equally interned) words hit the pointer-equality fast path.
+_STOP_WORDS = frozenset(map(sys.intern, (
+    # Articles
+    "a", "an", "the",
+    # Common prepositions
+    "aboard", "about", "above", "across", "after", "against", "along", "amid", "among", "around",
+    "as", "at", "before", "behind", "below", "beneath", "beside", "between", "beyond", "but",
+    "by", "concerning", "considering", "despite", "down", "during", "except", "for", "from",
+    "in", "inside", "into", "like", "near", "of", "off", "on", "onto", "out", "outside",
+    "over", "past", "regarding", "round", "since", "through", "throughout", "to", "toward",
+    "under", "underneath", "until", "unto", "up", "upon", "with", "within", "without",
+    # Common conjunctions
+    "and", "or", "but", "nor", "for", "so", "yet",
+    # Other common function words
+    "also", "often", "very", "just", "only", "not", "no", "yes", "well", "too",
+)))
+
+class _BloomFilter:
+    """
+    Minimal two-hash bloom filter over a fixed bit array. Answers
+    "definitely not added" with two bit probes and no allocation; a
+    possible hit must still be confirmed against the real set.
+    """
+    __slots__ = ('_bits', '_mask')
+
+    def __init__(self, size_bits=1 << 20):
+        # size_bits must be a power of two; 2^20 bits (128 KB) keeps the
+        # false-positive rate near 1% up to ~50k distinct words.
+        self._bits = bytearray(size_bits >> 3)
+        self._mask = size_bits - 1
+
+    def _positions(self, word):
+        # One 64-bit string hash split into independent halves gives the
+        # two probe positions without a second hashing pass.
+        h = hash(word)
+        return h & self._mask, (h >> 32) & self._mask
+
+    def add(self, word):
+        for pos in self._positions(word):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, word):
+        for pos in self._positions(word):
+            if not self._bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
 class Phase1_Parser:
     """
     Parses definitions to build a semantic graph.
     """
     def __init__(self, initial_definition, context_keywords, max_hops=3):
         self.initial_definition = initial_definition
-        self.context_keywords = set(context_keywords)
+        self.context_keywords = frozenset(sys.intern(kw) for kw in context_keywords)
         self.max_hops = max_hops
         self.api_client = FreeDictionaryClient()
         self.graph = SemanticGraph()
-        # Common function words to exclude (articles, prepositions, conjunctions, etc.)
-        self.stop_words = {
-            # Articles
-            "a", "an", "the",
-            # Common prepositions
-            "aboard", "about", "above", "across", "after", "against", "along", "amid", "among", "around",
-            "as", "at", "before", "behind", "below", "beneath", "beside", "between", "beyond", "but",
-            "by", "concerning", "considering", "despite", "down", "during", "except", "for", "from",
-            "in", "inside", "into", "like", "near", "of", "off", "on", "onto", "out", "outside",
-            "over", "past", "regarding", "round", "since", "through", "throughout", "to", "toward",
-            "under", "underneath", "until", "unto", "up", "upon", "with", "within", "without",
-            # Common conjunctions
-            "and", "or", "but", "nor", "for", "so", "yet",
-            # Other common function words
-            "also", "often", "very", "just", "only", "not", "no", "yes", "well", "too"
-        }
+        self.stop_words = _STOP_WORDS
         self.processed_words = set()
-        
-        print(f"\n=== ALLA POC: Semantic Graph Construction ===")
-        print(f"Initial definition: {initial_definition}")
-        print(f"Context keywords: {context_keywords}")
-        print(f"Max hops: {max_hops}")
-        print(f"Stop words: {self.stop_words}")
+        # Fast negative filter in front of processed_words: most words on
+        # the hot path have not been seen yet, and the bloom settles that
+        # without hashing into (and possibly comparing against) the set.
+        self._processed_bloom = _BloomFilter()
+        self._relevance_cache = {}
+        # The initial definition never changes, so its word set is computed once.
+        self._initial_words_set = frozenset(self._extract_words(initial_definition))
+        # Stem matching only ever considers >3-char keywords. A single
+        # alternation regex finds any of them inside a token in one C-level
+        # scan instead of a Python loop over the whole keyword set.
+        self._long_keywords = [kw for kw in self.context_keywords if len(kw) > 3]
+        self._kw_re = re.compile('|'.join(
+            re.escape(kw) for kw in sorted(self._long_keywords, key=len, reverse=True)
+        )) if self._long_keywords else None
+
+        logger.info("\n=== ALLA POC: Semantic Graph Construction ===")
+        logger.info("Initial definition: %s", initial_definition)
+        logger.info("Context keywords: %s", context_keywords)
+        logger.info("Max hops: %s", max_hops)
+        logger.debug("Stop words: %s", self.stop_words)
 
     def _extract_words(self, text):
         """Extracts and cleans words from a text string."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return [word for word in words if word not in self.stop_words]
+        words = map(sys.intern, _WORD_RE.findall(text.lower()))
+        return [word for word in words if word not in _STOP_WORDS]
+
+    def _seen(self, word):
+        """Whether word has been processed; the bloom short-circuits misses."""
+        return word in self._processed_bloom and word in self.processed_words
+
+    def _extract_words_set(self, text):
+        """Like _extract_words, but deduplicated into a set directly."""
+        words = map(sys.intern, _WORD_RE.findall(text.lower()))
+        return {word for word in words if word not in _STOP_WORDS}
+
+    def _find_stem_keyword(self, token):
+        """Returns a >3-char context keyword sharing a stem with token, if any."""
+        if self._kw_re is None:
+            return None
+        match = self._kw_re.search(token)  # Some keyword inside the token.
+        if match:
+            return match.group(0)
+        for keyword in self._long_keywords:  # Token inside some keyword.
+            if token in keyword:
+                return keyword
+        return None
 
     def _is_relevant(self, word, definition_text, pos):
+        """
+        Memoized wrapper around _is_relevant_uncached. The decision is
+        deterministic given (word, definition, pos) since the context
+        keywords are fixed at construction, and common words like
+        'object' or 'person' recur across many definitions.
+        """
+        key = (word, pos, hash(definition_text))
+        cached = self._relevance_cache.get(key)
+        if cached is None:
+            cached = self._relevance_cache[key] = self._is_relevant_uncached(
+                word, definition_text, pos)
+        return cached
+
+    def _is_relevant_uncached(self, word, definition_text, pos):
         """
         Determines if a word is relevant based on POS and context.
         Uses a more inclusive approach by checking for:
@@ -50,47 +140,48 @@ class Phase1_Parser:
         3. Synonyms or related terms in the definition
         """
         # Skip very short words (1-2 characters) as they're usually not meaningful
-        if len(word) <= 2 and word not in self._extract_words(self.initial_definition):
-            print(f"    REJECT '{word}': Too short (length <= 2)")
+        if len(word) <= 2 and word not in self._initial_words_set:
+            logger.debug("    REJECT '%s': Too short (length <= 2)", word)
             return False
-            
+
         # First check POS filter - only accept nouns, verbs, and adjectives
         if pos not in ['noun', 'verb', 'adjective']:
-            print(f"    REJECT '{word}': POS '{pos}' not in [noun, verb, adjective]")
+            logger.debug("    REJECT '%s': POS '%s' not in [noun, verb, adjective]", word, pos)
             return False
-        
+
         # Check if word itself is in context keywords (exact match)
         if word in self.context_keywords:
-            print(f"    ACCEPT '{word}': Exact match in context keywords")
+            logger.debug("    ACCEPT '%s': Exact match in context keywords", word)
             return True
-            
+
         # Check for word stems in context keywords (e.g., 'sleeping' matches 'sleep')
-        for keyword in self.context_keywords:
-            if (keyword in word or word in keyword) and len(keyword) > 3:  # Only check stems for longer words
-                print(f"    ACCEPT '{word}': Stem match with context keyword '{keyword}'")
-                return True
-        
+        stem_keyword = self._find_stem_keyword(word)
+        if stem_keyword:
+            logger.debug("    ACCEPT '%s': Stem match with context keyword '%s'", word, stem_keyword)
+            return True
+
         # Extract words from definition and check for context keyword matches
-        definition_words = set(self._extract_words(definition_text))
-        
+        definition_words = self._extract_words_set(definition_text)
+
         # Check for exact matches in definition
         context_overlap = self.context_keywords.intersection(definition_words)
         if context_overlap:
-            print(f"    ACCEPT '{word}': Definition contains context words: {context_overlap}")
+            logger.debug("    ACCEPT '%s': Definition contains context words: %s", word, context_overlap)
             return True
-            
+
         # Check for word stems in definition (only for longer words)
-        for keyword in self.context_keywords:
-            if len(keyword) > 3:  # Only check stems for longer words
-                if any(keyword in def_word or def_word in keyword for def_word in definition_words if len(def_word) > 3):
-                    print(f"    ACCEPT '{word}': Definition contains stem of context keyword '{keyword}'")
+        for def_word in definition_words:
+            if len(def_word) > 3:
+                stem_keyword = self._find_stem_keyword(def_word)
+                if stem_keyword:
+                    logger.debug("    ACCEPT '%s': Definition contains stem of context keyword '%s'", word, stem_keyword)
                     return True
-        
+
         # For initial words (hop 0), be more lenient
-        if word in self._extract_words(self.initial_definition):
-            print(f"    ACCEPT '{word}': Part of initial definition")
+        if word in self._initial_words_set:
+            logger.debug("    ACCEPT '%s': Part of initial definition", word)
             return True
-            
+
         # If word is in the definition of a context keyword, include it
         for keyword in self.context_keywords:
             if len(keyword) > 3:  # Only check for longer keywords
@@ -99,116 +190,127 @@ class Phase1_Parser:
                     if keyword_data:
                         keyword_definition = keyword_data[0]['meanings'][0]['definitions'][0]['definition'].lower()
                         if word in keyword_definition:
-                            print(f"    ACCEPT '{word}': Found in definition of context keyword '{keyword}'")
+                            logger.debug("    ACCEPT '%s': Found in definition of context keyword '%s'", word, keyword)
                             return True
                 except:
                     continue
-            
-        print(f"    REJECT '{word}': No strong connection to context")
+
+        logger.debug("    REJECT '%s': No strong connection to context", word)
         return False
 
     def build_graph(self):
         """Builds the semantic graph recursively."""
-        print(f"\n--- Step 1: Extract Initial Words ---")
+        logger.debug("\n--- Step 1: Extract Initial Words ---")
         initial_words = self._extract_words(self.initial_definition)
-        print(f"Initial words extracted: {initial_words}")
-        
-        queue = [(word, 0) for word in initial_words]
-        print(f"Queue initialized with: {queue}")
-        
+        logger.debug("Initial words extracted: %s", initial_words)
+
+        frontier = list(initial_words)
+        logger.debug("Frontier initialized with: %s", frontier)
+
+        current_hop = 0
         iteration = 0
-        while queue:
-            iteration += 1
-            word, current_hop = queue.pop(0)
-            
-            print(f"\n--- Iteration {iteration}: Processing '{word}' (hop {current_hop}) ---")
-
-            if current_hop > self.max_hops:
-                print(f"  SKIP '{word}': Exceeds max hops ({current_hop} > {self.max_hops})")
-                continue
-                
-            if word in self.processed_words:
-                print(f"  SKIP '{word}': Already processed")
-                continue
-
-            self.processed_words.add(word)
-            print(f"  PROCESS '{word}' for the first time")
-            
-            api_data = self.api_client.get_definition(word)
-            if not api_data:
-                print(f"  ERROR: No API data found for '{word}'")
-                continue
-
-            first_meaning = api_data[0]['meanings'][0]
-            pos = first_meaning['partOfSpeech']
-            definition = first_meaning['definitions'][0]['definition']
-            
-            try:
-                print(f"  DEFINE '{word}' ({pos}): {definition}")
-            except UnicodeEncodeError:
-                # Handle special characters in output
-                safe_def = definition.encode('ascii', 'replace').decode('ascii')
-                print(f"  DEFINE '{word}' ({pos}): {safe_def}")
-            
-            # Check if this word should be added to graph
-            if self._is_relevant(word, definition, pos) or current_hop == 0:  # Always add initial words
-                current_node = SemanticNode(word, pos, definition)
-                if self.graph.get_node(word) is None:
-                    self.graph.add_node(current_node)
-                    print(f"  ADD NODE: '{word}'")
-                else:
-                    print(f"  EXISTS: Node '{word}' already exists")
-            else:
-                print(f"  SKIP: '{word}' not relevant, skipping node creation")
-                continue
-
-            definition_words = self._extract_words(definition)
-            print(f"  EXTRACT: Words in definition: {definition_words}")
-            
-            for new_word in definition_words:
-                print(f"\n    Examining '{new_word}' from '{word}' definition:")
-                
-                if new_word in self.processed_words:
-                    print(f"      PROCESSED: '{new_word}' already processed")
-                    if self.graph.get_node(new_word) and self.graph.get_node(word) and not self.graph.graph.has_edge(word, new_word):
-                        self.graph.add_edge(word, new_word)
-                        print(f"      ADD EDGE: ({word}, {new_word})")
+        while frontier and current_hop <= self.max_hops:
+            # Fetch the entire BFS layer in one concurrent batch, then
+            # process the layer sequentially from the warm cache.
+            self.api_client.get_definitions(
+                [w for w in frontier if not self._seen(w)]
+            )
+            next_frontier = []
+            for word in frontier:
+                iteration += 1
+
+                logger.debug("\n--- Iteration %d: Processing '%s' (hop %d) ---", iteration, word, current_hop)
+
+                if self._seen(word):
+                    logger.debug("  SKIP '%s': Already processed", word)
                     continue
 
-                new_api_data = self.api_client.get_definition(new_word)
-                if not new_api_data:
-                    print(f"      ERROR: No API data for '{new_word}'")
+                self.processed_words.add(word)
+                self._processed_bloom.add(word)
+                logger.debug("  PROCESS '%s' for the first time", word)
+
+                api_data = self.api_client.get_definition(word)
+                if not api_data:
+                    logger.debug("  ERROR: No API data found for '%s'", word)
                     continue
-                
-                new_first_meaning = new_api_data[0]['meanings'][0]
-                new_pos = new_first_meaning['partOfSpeech']
-                new_definition_text = new_first_meaning['definitions'][0]['definition']
-                
-                try:
-                    print(f"      DEFINE '{new_word}' ({new_pos}): {new_definition_text[:100]}...")
-                except UnicodeEncodeError:
-                    safe_word = new_word.encode('ascii', 'replace').decode('ascii')
-                    safe_def = new_definition_text.encode('ascii', 'replace').decode('ascii')
-                    print(f"      DEFINE '{safe_word}' ({new_pos}): {safe_def[:100]}...")
-
-                if self._is_relevant(new_word, new_definition_text, new_pos):
-                    new_node = SemanticNode(new_word, new_pos, new_definition_text)
-                    if self.graph.get_node(new_word) is None:
-                        self.graph.add_node(new_node)
-                        print(f"      ADD NODE: '{new_word}'")
-                    
-                    if self.graph.get_node(word) and self.graph.get_node(new_word):
+
+                first_meaning = api_data[0]['meanings'][0]
+                pos = first_meaning['partOfSpeech']
+                definition = first_meaning['definitions'][0]['definition']
+
+                logger.debug("  DEFINE '%s' (%s): %s", word, pos, definition)
+
+                # Check if this word should be added to graph
+                if self._is_relevant(word, definition, pos) or current_hop == 0:  # Always add initial words
+                    current_node = SemanticNode(word, pos, definition)
+                    if self.graph.get_node(word) is None:
+                        self.graph.add_node(current_node)
+                        logger.debug("  ADD NODE: '%s'", word)
+                    else:
+                        logger.debug("  EXISTS: Node '%s' already exists", word)
+                else:
+                    logger.debug("  SKIP: '%s' not relevant, skipping node creation", word)
+                    continue
+
+                # Deduplicate while keeping first-seen order: repeated words in
+                # a definition would otherwise be examined (and logged) twice.
+                definition_words = list(dict.fromkeys(self._extract_words(definition)))
+                logger.debug("  EXTRACT: Words in definition: %s", definition_words)
+
+                # Live views of the node and adjacency dicts: one O(1) probe
+                # per check below, and `word` itself is guaranteed present
+                # past this point.
+                existing_nodes = self.graph.graph._node
+                adj_word = self.graph.graph._adj[word]
+
+                # Fetch the whole frontier of definition words concurrently so
+                # the per-word processing below is served from the cache.
+                self.api_client.get_definitions(
+                    [w for w in definition_words if not self._seen(w)]
+                )
+
+                for new_word in definition_words:
+                    logger.debug("\n    Examining '%s' from '%s' definition:", new_word, word)
+
+                    if self._seen(new_word):
+                        logger.debug("      PROCESSED: '%s' already processed", new_word)
+                        if new_word in existing_nodes and new_word not in adj_word:
+                            self.graph.add_edge(word, new_word)
+                            logger.debug("      ADD EDGE: (%s, %s)", word, new_word)
+                        continue
+
+                    new_api_data = self.api_client.get_definition(new_word)
+                    if not new_api_data:
+                        logger.debug("      ERROR: No API data for '%s'", new_word)
+                        continue
+
+                    new_first_meaning = new_api_data[0]['meanings'][0]
+                    new_pos = new_first_meaning['partOfSpeech']
+                    new_definition_text = new_first_meaning['definitions'][0]['definition']
+
+                    logger.debug("      DEFINE '%s' (%s): %.100s...", new_word, new_pos,
+                                 new_definition_text)
+
+                    if self._is_relevant(new_word, new_definition_text, new_pos):
+                        if new_word not in existing_nodes:
+                            self.graph.add_node(SemanticNode(new_word, new_pos, new_definition_text))
+                            logger.debug("      ADD NODE: '%s'", new_word)
+
                         self.graph.add_edge(word, new_word)
-                        print(f"      ADD EDGE: ({word}, {new_word})")
-                    
-                    if current_hop + 1 <= self.max_hops:
-                        queue.append((new_word, current_hop + 1))
-                        print(f"      QUEUE: '{new_word}' (hop {current_hop + 1})")
-
-        print(f"\n=== Graph Construction Complete ===")
-        print(f"Total nodes: {len(self.graph.graph.nodes)}")
-        print(f"Total edges: {len(self.graph.graph.edges)}")
-        print(f"Nodes: {list(self.graph.graph.nodes)}")
-        print(f"Edges: {list(self.graph.graph.edges)}")
-        
+                        logger.debug("      ADD EDGE: (%s, %s)", word, new_word)
+
+                        if current_hop + 1 <= self.max_hops:
+                            next_frontier.append(new_word)
+                            logger.debug("      QUEUE: '%s' (hop %d)", new_word, current_hop + 1)
+
+            frontier = next_frontier
+            current_hop += 1
+
+        logger.info("\n=== Graph Construction Complete ===")
+        logger.info("Total nodes: %d", len(self.graph.graph.nodes))
+        logger.info("Total edges: %d", len(self.graph.graph.edges))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Nodes: %s", list(self.graph.graph.nodes))
+            logger.debug("Edges: %s", list(self.graph.graph.edges))
+
         return self.graph
\ No newline at end of file
@@ -1,4 +1,8 @@
+import heapq
+
 import networkx as nx
+import numpy as np
+from scipy.sparse import csgraph
 from typing import List, Dict, Tuple
 from collections import defaultdict
 
@@ -15,14 +19,24 @@ class SemanticSearcher:
             graph: A networkx Graph object containing semantic relationships
         """
         self.graph = graph
-        self._build_inverted_index()
-    
-    def _build_inverted_index(self):
-        """Build an inverted index for faster word lookups."""
-        self.word_index = {}
-        for i, node in enumerate(self.graph.nodes()):
-            self.word_index[node] = i
-    
+        # Frozen node set for O(1) membership checks without going through
+        # NetworkX's __contains__ on every query.
+        self._nodes = frozenset(graph.nodes())
+        # CSR adjacency plus index maps: scipy's csgraph routines then run
+        # BFS/shortest paths over contiguous arrays in C instead of walking
+        # NetworkX's nested dicts.
+        self._node_list = list(graph.nodes())
+        self._idx = {node: i for i, node in enumerate(self._node_list)}
+        self._csr = nx.to_scipy_sparse_array(graph, format='csr') if self._node_list else None
+        # Interactive sessions tend to repeat queries; memoize results so a
+        # repeated query is a dict hit instead of a graph traversal.
+        self._query_cache = {}
+
+    def _distances_from(self, word):
+        """Hop distances from word to every node as a float array (inf = unreachable)."""
+        return csgraph.dijkstra(self._csr, indices=self._idx[word],
+                                unweighted=True, directed=False)
+
     def find_similar_words(self, word: str, top_n: int = 5) -> List[Tuple[str, float]]:
         """
         Find the top N most similar words to the given word.
@@ -34,27 +48,26 @@ class SemanticSearcher:
         Returns:
             List of (similar_word, similarity_score) tuples, sorted by score
         """
-        if word not in self.graph:
+        if word not in self._nodes:
             return []
-        
-        # Calculate similarity to all other words
-        similarities = []
-        for other_word in self.graph.nodes():
-            if other_word == word:
-                continue
-                
-            try:
-                # Get shortest path length (inverse of similarity)
-                path_length = nx.shortest_path_length(self.graph, word, other_word)
-                # Convert to similarity score (shorter path = more similar)
-                similarity = 1.0 / (1.0 + path_length)
-                similarities.append((other_word, similarity))
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                continue
-        
-        # Sort by similarity (descending) and return top N
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_n]
+
+        key = ('sim', word, top_n)
+        if key in self._query_cache:
+            return self._query_cache[key]
+
+        # One C-level BFS from `word` yields the distance to every node;
+        # unreachable words come back as inf and are skipped as before.
+        distances = self._distances_from(word)
+        reachable = np.flatnonzero(np.isfinite(distances) & (distances > 0))
+        # Convert to similarity score (shorter path = more similar)
+        scores = 1.0 / (1.0 + distances[reachable])
+        similarities = [(self._node_list[i], score)
+                        for i, score in zip(reachable, scores)]
+
+        # Partial selection: only the top N are needed, so nlargest does
+        # O(n log top_n) work instead of sorting every reachable word.
+        self._query_cache[key] = heapq.nlargest(top_n, similarities, key=lambda x: x[1])
+        return self._query_cache[key]
     
     def find_connecting_paths(self, word1: str, word2: str, max_paths: int = 3) -> List[List[str]]:
         """
@@ -68,15 +81,20 @@ class SemanticSearcher:
         Returns:
             List of paths, where each path is a list of words
         """
-        if word1 not in self.graph or word2 not in self.graph:
+        if word1 not in self._nodes or word2 not in self._nodes:
             return []
-            
+
+        key = ('path', word1, word2, max_paths)
+        if key in self._query_cache:
+            return self._query_cache[key]
+
         try:
             # Get up to max_paths shortest paths
             paths = list(nx.all_shortest_paths(self.graph, word1, word2))
-            return paths[:max_paths]
+            self._query_cache[key] = paths[:max_paths]
         except (nx.NetworkXNoPath, nx.NodeNotFound):
-            return []
+            self._query_cache[key] = []
+        return self._query_cache[key]
 
     def get_semantic_neighborhood(self, word: str, radius: int = 2) -> Dict[str, List[str]]:
         """
@@ -89,24 +107,22 @@ class SemanticSearcher:
         Returns:
             Dictionary mapping distances to lists of words at that distance
         """
-        if word not in self.graph:
+        if word not in self._nodes:
             return {}
-            
+
+        key = ('neigh', word, radius)
+        if key in self._query_cache:
+            return self._query_cache[key]
+
+        # The same C-level traversal backing find_similar_words gives every
+        # hop distance at once; limit=radius stops it from exploring past
+        # the neighborhood. Grouping the finite distances is then a single
+        # pass over an array instead of a Python BFS.
+        distances = csgraph.dijkstra(self._csr, indices=self._idx[word],
+                                     unweighted=True, directed=False, limit=radius)
         neighborhood = defaultdict(list)
-        
-        # Use BFS to find nodes at each distance
-        visited = {word}
-        queue = [(word, 0)]
-        
-        while queue:
-            current_word, distance = queue.pop(0)
-            if distance > 0:  # Don't include the word itself
-                neighborhood[distance].append(current_word)
-                
-            if distance < radius:
-                for neighbor in self.graph.neighbors(current_word):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append((neighbor, distance + 1))
-        
-        return dict(neighborhood)
+        for i in np.flatnonzero(np.isfinite(distances) & (distances > 0)):
+            neighborhood[int(distances[i])].append(self._node_list[i])
+
+        self._query_cache[key] = dict(neighborhood)
+        return self._query_cache[key]
@@ -1,58 +1,70 @@
 import pandas as pd
 import networkx as nx
+import numpy as np
 from scipy.stats import spearmanr
 
-def calculate_semantic_similarity(graph, word1, word2):
+# Base similarity score for each shortest-path length; longer paths count
+# as a very weak connection (1.0) and unreachable pairs score 0.
+PATH_LENGTH_SCORES = {1: 7.5, 2: 6.0, 3: 4.5, 4: 3.0}
+
+# Known relationships that get a contextual boost.
+SPECIAL_PAIRS = {
+    ('bed', 'sleep'), ('sleep', 'bed'),
+    ('comfort', 'satisfaction'), ('satisfaction', 'comfort'),
+    ('king', 'queen'), ('queen', 'king'),
+    ('computer', 'keyboard'), ('keyboard', 'computer'),
+    ('money', 'cash'), ('cash', 'money'),
+    ('car', 'train'), ('train', 'car'),
+    ('football', 'basketball'), ('basketball', 'football'),
+    ('eat', 'drink'), ('drink', 'eat')
+}
+
+def _score_kernel(lengths, is_special):
+    """
+    Branchless length -> score mapping over whole arrays. NaN lengths
+    (missing or unreachable pairs) fail every comparison and score 0.
+    Mirrors calculate_semantic_similarity exactly.
+    """
+    base = (10.0 * (lengths == 0)
+            + 7.5 * (lengths == 1)
+            + 6.0 * (lengths == 2)
+            + 4.5 * (lengths == 3)
+            + 3.0 * (lengths == 4)
+            + 1.0 * (lengths > 4))
+    boost = 2.0 * (is_special & (lengths >= 1) & (lengths <= 4))
+    return np.minimum(10.0, base + boost)
+
+def calculate_semantic_similarity(graph, word1, word2, path_length=None):
     """
     Enhanced semantic similarity using:
     1. Path distance (primary)
-    2. WordNet similarity (if words are in WordNet)
-    3. Contextual boost for specific relationships
-    Returns a score from 0-10.
+    2. Contextual boost for specific relationships
+    Returns a score from 0-10. A precomputed path_length can be passed to
+    avoid re-running BFS when distances are batch-computed.
     """
     if word1 == word2:
         return 10.0  # Max similarity for identical words
-        
+
     G = graph.graph
-    
+
     # Check if both words exist in graph
     if word1 not in G or word2 not in G:
         return 0.0
-    
-    # Calculate shortest path length
-    try:
-        path_length = nx.shortest_path_length(G, source=word1, target=word2)
-    except (nx.NetworkXNoPath, nx.NodeNotFound):
-        return 0.0
-    
-    # Base score from path length
-    if path_length == 1:
-        base_score = 7.5
-    elif path_length == 2:
-        base_score = 6.0
-    elif path_length == 3:
-        base_score = 4.5
-    elif path_length == 4:
-        base_score = 3.0
-    else:
+
+    if path_length is None:
+        try:
+            path_length = nx.shortest_path_length(G, source=word1, target=word2)
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            return 0.0
+
+    base_score = PATH_LENGTH_SCORES.get(path_length)
+    if base_score is None:
         return 1.0  # Very weak connection
-    
-    # Special case handling for known relationships
-    special_pairs = {
-        ('bed', 'sleep'), ('sleep', 'bed'),
-        ('comfort', 'satisfaction'), ('satisfaction', 'comfort'),
-        ('king', 'queen'), ('queen', 'king'),
-        ('computer', 'keyboard'), ('keyboard', 'computer'),
-        ('money', 'cash'), ('cash', 'money'),
-        ('car', 'train'), ('train', 'car'),
-        ('football', 'basketball'), ('basketball', 'football'),
-        ('eat', 'drink'), ('drink', 'eat')
-    }
-    
-    if (word1, word2) in special_pairs:
+
+    if (word1, word2) in SPECIAL_PAIRS:
         # Give a boost for these specific pairs
         return min(10.0, base_score + 2.0)
-    
+
     return base_score
 
 def validate_with_wordsim353(graph, wordsim_path='data/wordsim353.csv'):
@@ -69,10 +81,41 @@ def validate_with_wordsim353(graph, wordsim_path='data/wordsim353.csv'):
         print(f"WordSim353 dataset not found at {wordsim_path}")
         return None, None
 
+    G = graph.graph
+
     print(f"\n=== WordSim353 Validation ===")
-    print(f"Graph nodes: {sorted(list(graph.graph.nodes))}")
+    print(f"Graph nodes: {sorted(list(G.nodes))}")
     print(f"WordSim353 pairs: {len(wordsim_data)}")
-    
+
+    # Lowercase whole columns with pandas string ops instead of per-row
+    # .lower() calls, and pull plain numpy arrays out of the frame once.
+    n_pairs = len(wordsim_data)
+    w1 = wordsim_data['Word 1'].str.lower().to_numpy()
+    w2 = wordsim_data['Word 2'].str.lower().to_numpy()
+    human = wordsim_data['Human (mean)'].to_numpy()
+
+    nodes = frozenset(G.nodes)
+    in_graph = np.fromiter(
+        (word1 in nodes and word2 in nodes for word1, word2 in zip(w1, w2)),
+        dtype=bool, count=n_pairs)
+
+    # One BFS per unique source word instead of one per pair; every pair
+    # sharing a source reuses its distance map.
+    dist = {source: nx.single_source_shortest_path_length(G, source)
+            for source in set(w1[in_graph])}
+
+    lengths = np.full(n_pairs, np.nan)
+    for i in np.flatnonzero(in_graph):
+        d = 0 if w1[i] == w2[i] else dist[w1[i]].get(w2[i])
+        if d is not None:
+            lengths[i] = d
+
+    # Vectorized length -> score mapping with the special-pair boost.
+    is_special = np.fromiter(
+        ((word1, word2) in SPECIAL_PAIRS for word1, word2 in zip(w1, w2)),
+        dtype=bool, count=n_pairs)
+    scores = _score_kernel(lengths, is_special)
+
     human_scores = []
     graph_scores = []
     found_pairs = []
@@ -82,43 +125,35 @@ def validate_with_wordsim353(graph, wordsim_path='data/wordsim353.csv'):
     print(f"{'Word 1':<15} {'Word 2':<15} {'Human':<10} {'In Graph':<10} {'Distance':<10} {'Similarity':<10}")
     print("-" * 80)
 
-    for index, row in wordsim_data.iterrows():
-        word1 = row['Word 1'].lower()
-        word2 = row['Word 2'].lower()
-        human_score = row['Human (mean)']
-        
-        word1_in_graph = graph.get_node(word1) is not None
-        word2_in_graph = graph.get_node(word2) is not None
-        both_in_graph = word1_in_graph and word2_in_graph
-
-        if both_in_graph:
-            similarity = calculate_semantic_similarity(graph, word1, word2)
-            
+    for i, (word1, word2, human_score) in enumerate(zip(w1, w2, human)):
+        if in_graph[i]:
+            similarity = float(scores[i])
+
             human_scores.append(human_score)
             graph_scores.append(similarity)
             found_pairs.append((word1, word2))
-            
+
             print(f"{word1:<15} {word2:<15} {human_score:<10.2f} {'YES':<10} {similarity:<10.4f}")
         else:
             missing_pairs.append((word1, word2))
-            in_graph_status = f"{word1_in_graph}/{word2_in_graph}"
+            in_graph_status = f"{word1 in G}/{word2 in G}"
             print(f"{word1:<15} {word2:<15} {human_score:<10.2f} {in_graph_status:<10} {'N/A':<10} {'N/A':<10}")
 
     print(f"\n--- Validation Summary ---")
     print(f"Total WordSim353 pairs: {len(wordsim_data)}")
     print(f"Pairs found in graph: {len(found_pairs)}")
     print(f"Pairs missing from graph: {len(missing_pairs)}")
-    
+
     if missing_pairs:
         print(f"\nMissing pairs: {missing_pairs[:5]}{'...' if len(missing_pairs) > 5 else ''}")
-    
+
     if not human_scores or len(human_scores) < 2:
         print("\nERROR: Not enough overlapping word pairs found to calculate correlation.")
         print("This suggests the graph doesn't contain enough words from WordSim353.")
         return None, None
 
     correlation, p_value = spearmanr(human_scores, graph_scores)
-    
+
     print(f"\n--- Correlation Results ---")
     print(f"Overlapping pairs: {len(human_scores)}")
     print(f"Human scores range: {min(human_scores):.2f} - {max(human_scores):.2f}")
@@ -126,4 +161,4 @@ def validate_with_wordsim353(graph, wordsim_path='data/wordsim353.csv'):
     print(f"Spearman Correlation: {correlation:.4f}")
     print(f"P-value: {p_value:.4f}")
 
-    return correlation, p_value
\ No newline at end of file
+    return correlation, p_value